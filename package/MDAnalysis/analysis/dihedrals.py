@@ -244,7 +244,6 @@ import matplotlib.pyplot as plt
 
 import warnings
 
-import MDAnalysis as mda
 from MDAnalysis.analysis.base import AnalysisBase
 from MDAnalysis.lib.distances import calc_dihedrals
 from MDAnalysis.analysis.data.filenames import Rama_ref, Janin_ref
@@ -267,15 +266,20 @@ class Dihedral(AnalysisBase):
     .. versionchanged:: 2.0.0
        :attr:`angles` results are now stored in a
        :class:`MDAnalysis.analysis.base.Results` instance.
+    .. versionchanged:: 2.8.0
+       Added the `backend` keyword.
 
     """
 
-    def __init__(self, atomgroups, **kwargs):
+    def __init__(self, atomgroups, backend='serial', **kwargs):
         """Parameters
         ----------
         atomgroups : list[AtomGroup]
             a list of :class:`~MDAnalysis.core.groups.AtomGroup` for which
             the dihedral angles are calculated
+        backend : {'serial', 'OpenMP'}, optional
+            Keyword selecting the type of acceleration passed on to
+            :func:`~MDAnalysis.lib.distances.calc_dihedrals`.
 
         Raises
         ------
@@ -286,26 +290,33 @@ class Dihedral(AnalysisBase):
         super(Dihedral, self).__init__(
             atomgroups[0].universe.trajectory, **kwargs)
         self.atomgroups = atomgroups
+        self._backend = backend
 
         if any([len(ag) != 4 for ag in atomgroups]):
             raise ValueError("All AtomGroups must contain 4 atoms")
 
-        self.ag1 = mda.AtomGroup([ag[0] for ag in atomgroups])
-        self.ag2 = mda.AtomGroup([ag[1] for ag in atomgroups])
-        self.ag3 = mda.AtomGroup([ag[2] for ag in atomgroups])
-        self.ag4 = mda.AtomGroup([ag[3] for ag in atomgroups])
+        # collect the atom indices into a single (n_dihedrals, 4) array so
+        # that no intermediate Atom objects have to be created
+        ix = np.concatenate([ag.ix for ag in atomgroups]).reshape(-1, 4)
+        atoms = atomgroups[0].universe.atoms
+        self.ag1 = atoms[ix[:, 0]]
+        self.ag2 = atoms[ix[:, 1]]
+        self.ag3 = atoms[ix[:, 2]]
+        self.ag4 = atoms[ix[:, 3]]
 
     def _prepare(self):
-        self.results.angles = []
+        self.results.angles = np.empty((self.n_frames, len(self.ag1)),
+                                       dtype=np.float64)
 
     def _single_frame(self):
-        angle = calc_dihedrals(self.ag1.positions, self.ag2.positions,
-                               self.ag3.positions, self.ag4.positions,
-                               box=self.ag1.dimensions)
-        self.results.angles.append(angle)
+        calc_dihedrals(self.ag1.positions, self.ag2.positions,
+                       self.ag3.positions, self.ag4.positions,
+                       box=self.ag1.dimensions,
+                       result=self.results.angles[self._frame_index],
+                       backend=self._backend)
 
     def _conclude(self):
-        self.results.angles = np.rad2deg(np.array(self.results.angles))
+        np.rad2deg(self.results.angles, out=self.results.angles)
 
     @property
     def angles(self):
@@ -339,6 +350,9 @@ class Ramachandran(AnalysisBase):
     check_protein : bool (optional)
         whether to raise an error if the provided atomgroup is not a
         subset of protein atoms
+    backend : {'serial', 'OpenMP'}, optional
+        Keyword selecting the type of acceleration passed on to
+        :func:`~MDAnalysis.lib.distances.calc_dihedrals`.
 
     Example
     -------
@@ -379,14 +393,17 @@ class Ramachandran(AnalysisBase):
     .. versionchanged:: 2.0.0
        :attr:`angles` results are now stored in a
        :class:`MDAnalysis.analysis.base.Results` instance.
+    .. versionchanged:: 2.8.0
+       Added the `backend` keyword.
 
     """
 
     def __init__(self, atomgroup, c_name='C', n_name='N', ca_name='CA',
-                 check_protein=True, **kwargs):
+                 check_protein=True, backend='serial', **kwargs):
         super(Ramachandran, self).__init__(
             atomgroup.universe.trajectory, **kwargs)
         self.atomgroup = atomgroup
+        self._backend = backend
         residues = self.atomgroup.residues
 
         if check_protein:
@@ -435,20 +452,26 @@ class Ramachandran(AnalysisBase):
 
 
     def _prepare(self):
-        self.results.angles = []
+        self.results.angles = np.empty((self.n_frames, len(self.ag1), 2),
+                                       dtype=np.float64)
+        # all five atom groups are read in one go; the first angle uses the
+        # atoms of ag1 to ag4 and the second those of ag2 to ag5, so stacking
+        # them lets both angles be calculated with a single call
+        self._atoms = sum([self.ag2, self.ag3, self.ag4, self.ag5], self.ag1)
 
     def _single_frame(self):
-        phi_angles = calc_dihedrals(self.ag1.positions, self.ag2.positions,
-                                    self.ag3.positions, self.ag4.positions,
-                                    box=self.ag1.dimensions)
-        psi_angles = calc_dihedrals(self.ag2.positions, self.ag3.positions,
-                                    self.ag4.positions, self.ag5.positions,
-                                    box=self.ag1.dimensions)
-        phi_psi = [(phi, psi) for phi, psi in zip(phi_angles, psi_angles)]
-        self.results.angles.append(phi_psi)
+        n = len(self.ag1)
+        positions = self._atoms.positions.reshape(5, n, 3)
+        angles = calc_dihedrals(positions[0:2].reshape(-1, 3),
+                                positions[1:3].reshape(-1, 3),
+                                positions[2:4].reshape(-1, 3),
+                                positions[3:5].reshape(-1, 3),
+                                box=self.ag1.dimensions,
+                                backend=self._backend)
+        self.results.angles[self._frame_index] = angles.reshape(2, n).T
 
     def _conclude(self):
-        self.results.angles = np.rad2deg(np.array(self.results.angles))
+        np.rad2deg(self.results.angles, out=self.results.angles)
 
     def plot(self, ax=None, ref=False, **kwargs):
         """Plots data into standard Ramachandran plot.
@@ -530,7 +553,7 @@ class Janin(Ramachandran):
 
     def __init__(self, atomgroup,
                  select_remove="resname ALA CYS* GLY PRO SER THR VAL",
-                 select_protein="protein",
+                 select_protein="protein", backend='serial',
                  **kwargs):
         r"""Parameters
         ----------
@@ -548,6 +571,10 @@ class Janin(Ramachandran):
             have non-standard amino acids then adjust this selection to include
             them
 
+        backend : {'serial', 'OpenMP'}, optional
+            Keyword selecting the type of acceleration passed on to
+            :func:`~MDAnalysis.lib.distances.calc_dihedrals`.
+
         Raises
         ------
         ValueError
@@ -565,10 +592,13 @@ class Janin(Ramachandran):
            `select_remove` and `select_protein` keywords were added.
            :attr:`angles` results are now stored in a
            :class:`MDAnalysis.analysis.base.Results` instance.
+        .. versionchanged:: 2.8.0
+           Added the `backend` keyword.
         """
         super(Ramachandran, self).__init__(
             atomgroup.universe.trajectory, **kwargs)
         self.atomgroup = atomgroup
+        self._backend = backend
         residues = atomgroup.residues
         protein = atomgroup.select_atoms(select_protein).residues
         remove = residues.atoms.select_atoms(select_remove).residues
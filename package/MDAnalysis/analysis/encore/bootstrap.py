@@ -146,8 +146,8 @@ def get_ensemble_bootstrap_samples(ensemble,
     for i in range(samples):
         indices = np.random.randint(
             low=0,
-            high=ensemble.trajectory.timeseries().shape[1],
-            size=ensemble.trajectory.timeseries().shape[1])
+            high=ensemble.trajectory.n_frames,
+            size=ensemble.trajectory.n_frames)
         ensembles.append(
             mda.Universe(ensemble.filename,
                         ensemble.trajectory.timeseries(order='fac')[indices,:,:],
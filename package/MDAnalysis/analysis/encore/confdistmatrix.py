@@ -96,8 +96,7 @@ def conformational_distance_matrix(ensemble,
     """
 
     # framesn: number of frames
-    framesn = len(ensemble.trajectory.timeseries(
-        ensemble.select_atoms(select), order='fac'))
+    framesn = ensemble.trajectory.n_frames
 
     # Prepare metadata recarray
     if metadata:
@@ -316,9 +315,7 @@ def get_distance_matrix(ensemble,
             "        Loading similarity matrix from: {0}".format(load_matrix))
         confdistmatrix = \
             TriangularMatrix(
-                size=ensemble.trajectory.timeseries(
-                    ensemble.select_atoms(select),
-                    order='fac').shape[0],
+                size=ensemble.trajectory.n_frames,
                 loadfile=load_matrix)
         logging.info("        Done!")
         for key in confdistmatrix.metadata.dtype.names:
@@ -326,10 +323,7 @@ def get_distance_matrix(ensemble,
                 key, str(confdistmatrix.metadata[key][0])))
 
         # Check matrix size for consistency
-        if not confdistmatrix.size == \
-                ensemble.trajectory.timeseries(
-                    ensemble.select_atoms(select),
-                    order='fac').shape[0]:
+        if not confdistmatrix.size == ensemble.trajectory.n_frames:
             logging.error(
                 "ERROR: The size of the loaded matrix and of the ensemble"
                 " do not match")
@@ -674,7 +674,8 @@ def prepare_ensembles_for_convergence_increasing_window(ensemble,
         size of the window (in number of frames) to be used
 
     select : str
-        Atom selection string in the MDAnalysis format. Default is "name CA"
+        Ignored. The slices always contain all atoms of `ensemble`; the
+        argument is only kept for backwards compatibility.
 
     Returns
     -------
@@ -685,10 +686,13 @@ def prepare_ensembles_for_convergence_increasing_window(ensemble,
         ensemble will be bigger if the length of the input ensemble
         is not exactly divisible by window_size.
 
+
+    .. versionchanged:: 2.8.0
+       `select` is no longer used to determine the number of frames and
+       has no effect.
     """
 
-    ens_size = ensemble.trajectory.timeseries(ensemble.select_atoms(select),
-                                              order='fac').shape[0]
+    ens_size = ensemble.trajectory.n_frames
 
     rest_slices = ens_size // window_size
     residuals = ens_size % window_size
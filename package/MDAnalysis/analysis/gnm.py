@@ -221,6 +221,12 @@ class GNMAnalysis(AnalysisBase):
           `Bonus_groups` is contained in `selection` as this could lead to
           double counting. No checks are applied.
 
+    Raises
+    ------
+    ValueError
+          If a group selected by `Bonus_groups` is empty or has zero total
+          mass.
+
     Attributes
     ----------
     results.times : numpy.ndarray
@@ -265,6 +271,20 @@ class GNMAnalysis(AnalysisBase):
         self.Bonus_groups = [self.u.select_atoms(item) for item in Bonus_groups] \
                             if Bonus_groups else []
         self.ca = self.u.select_atoms(self.select)
+        for item, ag in zip(Bonus_groups or [], self.Bonus_groups):
+            if len(ag) == 0:
+                raise ValueError(f"Bonus group '{item}' is empty")
+            if ag.masses.sum() == 0:
+                raise ValueError(f"Bonus group '{item}' has zero total mass")
+        if self.Bonus_groups:
+            # all bonus atoms are gathered in one go per frame; the centers of
+            # mass are then obtained as a single weighted segmented sum
+            self._bonus_atoms = sum(self.Bonus_groups[1:],
+                                    self.Bonus_groups[0])
+            self._bonus_offsets = np.cumsum(
+                [0] + [len(ag) for ag in self.Bonus_groups[:-1]])
+            self._bonus_weights = np.concatenate(
+                [ag.masses / ag.masses.sum() for ag in self.Bonus_groups])
 
     def _generate_output(self, w, v, outputobject,
                          ReportVector=None, counter=0):
@@ -306,9 +326,11 @@ class GNMAnalysis(AnalysisBase):
         positions = self.ca.positions
 
         #add the com from each bonus group to the ca_positions list
-        for item in self.Bonus_groups:
-            #bonus = self.u.select_atoms(item)
-            positions = np.vstack((positions, item.center_of_mass()))
+        if self.Bonus_groups:
+            weighted = (self._bonus_atoms.positions *
+                        self._bonus_weights[:, np.newaxis])
+            coms = np.add.reduceat(weighted, self._bonus_offsets, axis=0)
+            positions = np.concatenate((positions, coms))
 
         natoms = len(positions)
         matrix = np.zeros((natoms, natoms), np.float64)
@@ -339,8 +339,10 @@ class EinsteinMSD(AnalysisBase):
         # these need to be zeroed prior to each run() call
         self.results.msds_by_particle = np.zeros((self.n_frames,
                                                   self.n_particles))
+        # coordinates are float32, so store them as such; they are only
+        # converted to float64 once for the MSD computation in _conclude()
         self._position_array = np.zeros(
-            (self.n_frames, self.n_particles, self.dim_fac))
+            (self.n_frames, self.n_particles, self.dim_fac), dtype=np.float32)
         # self.results.timeseries not set here
 
     def _parse_msd_type(self):
@@ -569,13 +569,15 @@ class PCA(AnalysisBase):
             pca_res_indices, pca_res_counts = np.unique(
                 self._atoms.resindices, return_counts=True)
 
-            non_pca_atoms = np.array([], dtype=int)
-            for res in group.residues:
-                # n_common is the number of pca atoms in a residue
-                n_common = pca_res_counts[np.where(
-                            pca_res_indices == res.resindex)][0]
-                non_pca_atoms = np.append(non_pca_atoms,
-                                          res.atoms.n_atoms - n_common)
+            # group.residues is sorted by resindex, as are the unique
+            # resindices of its atoms, so the counts line up per residue
+            residues = group.residues
+            _, res_counts = np.unique(residues.atoms.resindices,
+                                      return_counts=True)
+            # n_common is the number of pca atoms in each residue
+            n_common = pca_res_counts[np.searchsorted(pca_res_indices,
+                                                      residues.resindices)]
+            non_pca_atoms = res_counts - n_common
             # index_extrapolate records the anchor number for each non-PCA atom
             index_extrapolate = np.repeat(np.arange(anchors.atoms.n_atoms),
                                           non_pca_atoms)
@@ -333,9 +333,9 @@ class DCDReader(base.ReaderBase):
             if len(atomgroup) == 0:
                 raise ValueError(
                     "Timeseries requires at least one atom to analyze")
-            atom_numbers = list(atomgroup.indices)
+            atom_numbers = atomgroup.indices
         else:
-            atom_numbers = list(range(self.n_atoms))
+            atom_numbers = None
 
         frames = self._file.readframes(
             start, stop, step, order=order, indices=atom_numbers)
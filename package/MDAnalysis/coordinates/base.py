@@ -1029,6 +1029,9 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
 
 
         .. versionadded:: 2.4.0
+        .. versionchanged:: 2.8.0
+            The returned array is always C-contiguous in the requested
+            `order`.
         """
         if asel is not None:
             warnings.warn(
@@ -1038,6 +1041,16 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
             if atomgroup:
                 raise ValueError("Cannot provide both asel and atomgroup kwargs")
             atomgroup = asel
+        # check the requested order before reading any frames
+        default_order = 'fac'
+        if any(key not in default_order for key in order):
+            raise ValueError(f"Unrecognized order key in {order}, "
+                             "must be permutation of 'fac'")
+        if sorted(order) != sorted(default_order):
+            errmsg = ("Repeated or missing keys passed to argument "
+                      f"`order`: {order}, each key must be used once")
+            raise ValueError(errmsg)
+
         start, stop, step = self.check_slice_indices(start, stop, step)
         nframes = len(range(start, stop, step))
 
@@ -1049,28 +1062,20 @@ class ProtoReader(IOBase, metaclass=_Readermeta):
             natoms = len(atom_numbers)
         else:
             natoms = self.n_atoms
-            atom_numbers = np.arange(natoms)
-
-        # allocate output array in 'fac' order
-        coordinates = np.empty((nframes, natoms, 3), dtype=np.float32)
+            atom_numbers = None
+
+        # allocate the output array directly in the requested order so that
+        # it is C-contiguous, and fill it through a 'fac' ordered view
+        shape = {'f': nframes, 'a': natoms, 'c': 3}
+        coordinates = np.empty([shape[key] for key in order],
+                               dtype=np.float32)
+        fac = coordinates.transpose([order.index(key)
+                                     for key in default_order])
         for i, ts in enumerate(self[start:stop:step]):
-            coordinates[i, :] = ts.positions[atom_numbers]
-
-        # switch axes around
-        default_order = 'fac'
-        if order != default_order:
-            try:
-                newidx = [default_order.index(i) for i in order]
-            except ValueError:
-                raise ValueError(f"Unrecognized order key in {order}, "
-                                 "must be permutation of 'fac'")
-
-            try:
-                coordinates = np.moveaxis(coordinates, newidx, [0, 1, 2])
-            except ValueError:
-                errmsg = ("Repeated or missing keys passed to argument "
-                          f"`order`: {order}, each key must be used once")
-                raise ValueError(errmsg)
+            if atom_numbers is None:
+                fac[i] = ts.positions
+            else:
+                fac[i] = ts.positions[atom_numbers]
         return coordinates
 
 # TODO: Change order of aux_spec and auxdata for 3.0 release, cf. Issue #3811
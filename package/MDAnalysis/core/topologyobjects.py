@@ -172,6 +172,7 @@ class Bond(TopologyObject):
        Now a subclass of :class:`TopologyObject`. Changed class to use
        :attr:`__slots__` and stores atoms in :attr:`atoms` attribute.
     """
+    __slots__ = ()
     btype = 'bond'
 
     def partner(self, atom):
@@ -214,6 +215,7 @@ class Angle(TopologyObject):
        Now a subclass of :class:`TopologyObject`; now uses
        :attr:`__slots__` and stores atoms in :attr:`atoms` attribute
     """
+    __slots__ = ()
     btype = 'angle'
 
     def angle(self, pbc=True):
@@ -261,6 +263,7 @@ class Dihedral(TopologyObject):
        Renamed to Dihedral (was Torsion)
 
     """
+    __slots__ = ()
     # http://cbio.bmt.tue.nl/pumma/uploads/Theory/dihedral.png
     btype = 'dihedral'
 
@@ -312,6 +315,7 @@ class ImproperDihedral(Dihedral):
     .. versionchanged:: 0.11.0
        Renamed to ImproperDihedral (was Improper_Torsion)
     """
+    __slots__ = ()
     # http://cbio.bmt.tue.nl/pumma/uploads/Theory/improper.png
     btype = 'improper'
 
@@ -335,6 +339,7 @@ class UreyBradley(TopologyObject):
 
     .. versionadded:: 1.0.0
     """
+    __slots__ = ()
     btype = 'ureybradley'
 
     def partner(self, atom):
@@ -367,6 +372,7 @@ class CMap(TopologyObject):
 
     .. versionadded:: 1.0.0
     """
+    __slots__ = ()
     btype = 'cmap'
 
 
@@ -575,6 +581,9 @@ class TopologyGroup(object):
     .. versionchanged::1.0.0
        ``type``, ``guessed``, and ``order`` are no longer reshaped to arrays
        with an extra dimension
+    .. versionchanged:: 2.8.0
+       The vertical AtomGroups (:attr:`atom1`, :attr:`atom2`, ...) are only
+       created when first accessed
     """
     def __init__(self, bondidx, universe, btype=None, type=None, guessed=None,
                  order=None):
@@ -612,20 +621,24 @@ class TopologyGroup(object):
             self._bondtypes = type[uniq_idx]
             self._guessed = guessed[uniq_idx]
             self._order = order[uniq_idx]
-
-            # Create vertical AtomGroups
-            self._ags = [universe.atoms[self._bix[:, i]]
-                         for i in range(self._bix.shape[1])]
         else:
             # Empty TopologyGroup
             self._bix = np.array([])
             self._bondtypes = np.array([])
             self._guessed = np.array([])
             self._order = np.array([])
-            self._ags = []
         self._u = universe
 
-        self._cache = dict()  # used for topdict saving
+        self._cache = dict()  # used for topdict and vertical AtomGroup saving
+
+    @property
+    @cached('ags')
+    def _ags(self):
+        # vertical AtomGroups, only created when first needed
+        if not len(self._bix):
+            return []
+        return [self._u.atoms[self._bix[:, i]]
+                for i in range(self._bix.shape[1])]
 
     @property
     def universe(self):
@@ -885,6 +898,64 @@ class TopologyGroup(object):
 
     # Distance calculation methods below
     # "Slow" versions exist as a way of testing the Cython implementations
+    def _check_btype(self, *btypes):
+        if not any(self.btype == btype for btype in btypes):
+            strbtype = "' or '".join(btypes)
+            raise TypeError(f"TopologyGroup is not of type '{strbtype}'")
+
+    def _calc_connection_vectors(self, *btypes, pbc=False):
+        self._check_btype(*btypes)
+        positions = [ag.positions.astype(np.float64) for ag in self._ags]
+        vectors = [b - a for a, b in zip(positions[:-1], positions[1:])]
+        box = None if not pbc or not vectors else self._ags[0].dimensions
+        if box is not None:
+            vectors = [distances.minimize_vectors(v, box) for v in vectors]
+        return vectors
+
+    def _bonds_slow(self, pbc=False):
+        """Vectorized NumPy version of :meth:`bonds`
+
+        .. versionadded:: 2.8.0
+        """
+        vectors = self._calc_connection_vectors("bond", pbc=pbc)
+        if not vectors:
+            return np.zeros(0, np.float64)
+        return np.linalg.norm(vectors[0], axis=1)
+
+    def _angles_slow(self, pbc=False):
+        """Vectorized NumPy version of :meth:`angles`
+
+        .. versionadded:: 2.8.0
+        """
+        vectors = self._calc_connection_vectors("angle", pbc=pbc)
+        if not vectors:
+            return np.zeros(0, np.float64)
+        # both vectors point away from the apex
+        v1, v2 = -vectors[0], vectors[1]
+        x = np.einsum('ij,ij->i', v1, v2)
+        y = np.linalg.norm(np.cross(v1, v2), axis=1)
+        return np.arctan2(y, x)
+
+    def _dihedrals_slow(self, pbc=False):
+        """Vectorized NumPy version of :meth:`dihedrals`
+
+        .. versionadded:: 2.8.0
+        """
+        vectors = self._calc_connection_vectors("dihedral", "improper",
+                                                pbc=pbc)
+        if not vectors:
+            return np.zeros(0, np.float64)
+        b1, b2, b3 = vectors
+        n1 = np.cross(b1, b2)
+        n2 = np.cross(b2, b3)
+        x = np.einsum('ij,ij->i', n1, n2)
+        y = (np.einsum('ij,ij->i', np.cross(n1, n2), b2) /
+             np.linalg.norm(b2, axis=1))
+        dihedrals = np.arctan2(y, x)
+        # undefined dihedrals are nan, consistent with calc_dihedrals
+        dihedrals[(x == 0) & (y == 0)] = np.nan
+        return dihedrals
+
     def values(self, **kwargs):
         """Return the size of each object in this Group
 
@@ -895,8 +966,13 @@ class TopologyGroup(object):
            *result*
               allows a predefined results array to be used,
               note that this will be overwritten
+           *backend*
+              select the type of acceleration used by
+              :mod:`MDAnalysis.lib.distances` [``'serial'``]
 
         .. versionadded:: 0.11.0
+        .. versionchanged:: 2.8.0
+           Added *backend* keyword.
         """
         if self.btype == 'bond':
             return self.bonds(**kwargs)
@@ -907,17 +983,16 @@ class TopologyGroup(object):
         elif self.btype == 'improper':
             return self.dihedrals(**kwargs)
 
-    def _calc_connection_values(self, func, *btypes, result=None, pbc=False):
-        if not any(self.btype == btype for btype in btypes):
-            strbtype = "' or '".join(btypes)
-            raise TypeError(f"TopologyGroup is not of type '{strbtype}'")
+    def _calc_connection_values(self, func, *btypes, result=None, pbc=False,
+                                backend='serial'):
+        self._check_btype(*btypes)
         if not result:
             result = np.zeros(len(self), np.float64)
         box = None if not pbc else self._ags[0].dimensions
         positions = [ag.positions for ag in self._ags]
-        return func(*positions, box=box, result=result)
+        return func(*positions, box=box, result=result, backend=backend)
 
-    def bonds(self, pbc=False, result=None):
+    def bonds(self, pbc=False, result=None, backend='serial'):
         """Calculates the distance between all bonds in this TopologyGroup
 
         :Keywords:
@@ -927,13 +1002,20 @@ class TopologyGroup(object):
            *result*
               allows a predefined results array to be used,
               note that this will be overwritten
+           *backend*
+              select the type of acceleration; ``'serial'``, ``'OpenMP'``
+              or, if installed, ``'distopia'`` ['serial']
 
         Uses cython implementation
+
+        .. versionchanged:: 2.8.0
+           Added *backend* keyword.
         """
         return self._calc_connection_values(distances.calc_bonds, "bond",
-                                            pbc=pbc, result=result)
+                                            pbc=pbc, result=result,
+                                            backend=backend)
 
-    def angles(self, result=None, pbc=False):
+    def angles(self, result=None, pbc=False, backend='serial'):
         """Calculates the angle in radians formed between a bond
         between atoms 1 and 2 and a bond between atoms 2 & 3
 
@@ -946,6 +1028,8 @@ class TopologyGroup(object):
             apply periodic boundary conditions when calculating angles
             [``False``] this is important when connecting vectors between
             atoms might require minimum image convention
+        backend : {'serial', 'OpenMP'}
+            keyword selecting the type of acceleration ['serial']
 
         Returns
         -------
@@ -953,12 +1037,15 @@ class TopologyGroup(object):
 
         .. versionchanged :: 0.9.0
            Added *pbc* option (default ``False``)
+        .. versionchanged:: 2.8.0
+           Added *backend* keyword.
 
         """
         return self._calc_connection_values(distances.calc_angles, "angle",
-                                            pbc=pbc, result=result)
+                                            pbc=pbc, result=result,
+                                            backend=backend)
 
-    def dihedrals(self, result=None, pbc=False):
+    def dihedrals(self, result=None, pbc=False, backend='serial'):
         """Calculate the dihedral angle in radians for this topology
         group.
 
@@ -974,6 +1061,8 @@ class TopologyGroup(object):
             apply periodic boundary conditions when calculating angles
             [``False``] this is important when connecting vectors between
             atoms might require minimum image convention
+        backend : {'serial', 'OpenMP'}
+            keyword selecting the type of acceleration ['serial']
 
         Returns
         -------
@@ -981,7 +1070,10 @@ class TopologyGroup(object):
 
         .. versionchanged:: 0.9.0
            Added *pbc* option (default ``False``)
+        .. versionchanged:: 2.8.0
+           Added *backend* keyword.
         """
         return self._calc_connection_values(distances.calc_dihedrals,
                                             "dihedral", "improper",
-                                            pbc=pbc, result=result)
+                                            pbc=pbc, result=result,
+                                            backend=backend)
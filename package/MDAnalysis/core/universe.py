@@ -54,6 +54,7 @@ Functions
 
 """
 import errno
+import numbers
 import numpy as np
 import logging
 import copy
@@ -1436,6 +1437,8 @@ class Universe(object):
 
 
         .. versionadded:: 2.0.0
+        .. versionchanged:: 2.8.0
+           `numConfs` accepts any integer type, including NumPy integers.
 
         """
         try:
@@ -1457,10 +1460,11 @@ class Universe(object):
                 "hydrogens with `addHs=True`")
 
             numConfs = rdkit_kwargs.pop("numConfs", numConfs)
-            if not (type(numConfs) is int and numConfs > 0):
+            if not (isinstance(numConfs, numbers.Integral)
+                    and not isinstance(numConfs, bool) and numConfs > 0):
                 raise SyntaxError("numConfs must be a non-zero positive "
                 "integer instead of {0}".format(numConfs))
-            AllChem.EmbedMultipleConfs(mol, numConfs, **rdkit_kwargs)
+            AllChem.EmbedMultipleConfs(mol, int(numConfs), **rdkit_kwargs)
 
         return cls(mol, **kwargs)
 
@@ -24,9 +24,6 @@ import numpy as np
 cimport numpy as cnp
 
 from libc.stdlib cimport free
-from cpython cimport PyObject, Py_INCREF
-
-from MDAnalysis.lib.util import no_copy_shim
 
 cnp.import_array()
 
@@ -112,11 +109,9 @@ cdef cnp.ndarray ptr_to_ndarray(void* data_ptr, cnp.int64_t[:] dim, int data_typ
     array_wrapper = ArrayWrapper()
     array_wrapper.set_data(<void*> data_ptr, <int*> &dim[0], dim.size, data_type)
 
-    cdef cnp.ndarray ndarray = np.array(array_wrapper, copy=no_copy_shim)
-    # Assign our object to the 'base' of the ndarray object
-    ndarray[:] = array_wrapper.__array__()
-    # Increment the reference count, as the above assignement was done in
-    # C, and Python does not know that there is this additional reference
-    Py_INCREF(array_wrapper)
+    cdef cnp.ndarray ndarray = array_wrapper.__array__()
+    # Assign our object to the 'base' of the ndarray object, so that the
+    # memory is freed together with the array instead of being copied
+    cnp.set_array_base(ndarray, array_wrapper)
 
     return ndarray
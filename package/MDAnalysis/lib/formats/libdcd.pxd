@@ -152,4 +152,7 @@ cdef class DCDFile:
                                  double[::1] unitcell, int first_frame)
 
 # Helper in readframes to copy given a specific memory layout
-cdef void copy_in_order(float[:, :] source, float[:, :, :] target, int order, int index)
+cdef void copy_in_order(float[:, :] source, cnp.int64_t[::1] indices,
+                        float[:, :, :] target, int order, int index) noexcept nogil
+cdef void copy_all_in_order(float[::1, :] source, float[:, :, ::1] target,
+                            int order, int index) noexcept nogil
@@ -75,6 +75,7 @@ cimport numpy as cnp
 from libc.stdio cimport SEEK_SET, SEEK_CUR, SEEK_END
 from libc.stdint cimport uintptr_t
 from libc.stdlib cimport free
+from libc.string cimport memcpy
 
 cnp.import_array()
 
@@ -638,13 +639,17 @@ cdef class DCDFile:
         cdef int n
         n = len(range(start, stop, step))
         cdef int natoms
-        cdef cnp.ndarray[cnp.int64_t, ndim=1] c_indices
-        if indices is None:
-            c_indices = cnp.PyArray_Arange(0, self.natoms, 1, cnp.NPY_INT64)
+        cdef cnp.ndarray[cnp.int64_t, ndim=1] c_indices = None
+        # without a selection every frame is copied as is, no gather needed
+        cdef bint all_atoms = indices is None
+        if all_atoms:
             natoms = self.natoms
         else:
             natoms = len(indices)
-            c_indices = np.asarray(indices, dtype=np.int64)
+            # indexing a range resolves negative indices and raises an
+            # IndexError for out of range ones before any frame is read
+            c_indices = cnp.PyArray_Arange(0, self.natoms, 1, cnp.NPY_INT64)[
+                np.asarray(indices, dtype=np.int64)]
         
         cdef cnp.npy_intp[3] dims
         cdef int hash_order = -1
@@ -698,22 +703,38 @@ cdef class DCDFile:
         cdef float[::1] y = xyz_tmp[:, 1]
         cdef float[::1] z = xyz_tmp[:, 2]
 
+        # acquire the views once so that no Python objects are created per
+        # frame when gathering the selected atoms into the output
+        cdef float[::1, :] xyz_tmp_view = xyz_tmp
+        cdef float[:, :, ::1] xyz_view = xyz
+        cdef double[:, ::1] box_view = box
+        cdef cnp.int64_t[::1] indices_view = c_indices
+
         cdef int ok, i, counter 
         
         if (start_ == 0) and (step_ == 1) and (stop_ == self.n_frames):
             for i in range(n):
-                ok = self.c_readframes_helper(x, y, z, box[i], i==0)
+                ok = self.c_readframes_helper(x, y, z, box_view[i], i==0)
                 if ok != 0 and ok != -4:
                     raise IOError("Reading DCD frames failed: {}".format(DCD_ERRORS[ok]))
-                copy_in_order(xyz_tmp[c_indices], xyz, hash_order, i)
+                if all_atoms:
+                    copy_all_in_order(xyz_tmp_view, xyz_view, hash_order, i)
+                else:
+                    copy_in_order(xyz_tmp_view, indices_view, xyz_view,
+                                  hash_order, i)
         else:
             counter = 0
             for i in range(start, stop, step):
                 self.seek(i)
-                ok = self.c_readframes_helper(x, y, z, box[counter], i==0)
+                ok = self.c_readframes_helper(x, y, z, box_view[counter], i==0)
                 if ok != 0 and ok != -4:
                     raise IOError("Reading DCD frames failed: {}".format(DCD_ERRORS[ok]))
-                copy_in_order(xyz_tmp[c_indices], xyz, hash_order, counter)
+                if all_atoms:
+                    copy_all_in_order(xyz_tmp_view, xyz_view, hash_order,
+                                      counter)
+                else:
+                    copy_in_order(xyz_tmp_view, indices_view, xyz_view,
+                                  hash_order, counter)
                 counter += 1
 
         return DCDFrame(xyz, box)
@@ -732,17 +753,65 @@ cdef class DCDFile:
         return ok
 
 
-# Helper in readframes to copy given a specific memory layout
-cdef void copy_in_order(float[:, :] source, float[:, :, :] target, int order, int index):
+# Helper in readframes to gather the atoms in `indices` from `source` into
+# frame `index` of `target` given a specific memory layout
+cdef void copy_in_order(float[:, :] source, cnp.int64_t[::1] indices,
+                        float[:, :, :] target, int order, int index) noexcept nogil:
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t natoms = indices.shape[0]
+    cdef Py_ssize_t ndims = source.shape[1]
+    if order == 1:  #  'fac':
+        for i in range(natoms):
+            for j in range(ndims):
+                target[index, i, j] = source[indices[i], j]
+    elif order == 2:  #  'fca':
+        for i in range(natoms):
+            for j in range(ndims):
+                target[index, j, i] = source[indices[i], j]
+    elif order == 3:  # 'afc':
+        for i in range(natoms):
+            for j in range(ndims):
+                target[i, index, j] = source[indices[i], j]
+    elif order == 4:  # 'acf':
+        for i in range(natoms):
+            for j in range(ndims):
+                target[i, j, index] = source[indices[i], j]
+    elif order == 5:  # 'caf':
+        for i in range(natoms):
+            for j in range(ndims):
+                target[j, i, index] = source[indices[i], j]
+    elif order == 6:  # 'cfa':
+        for i in range(natoms):
+            for j in range(ndims):
+                target[j, index, i] = source[indices[i], j]
+
+
+cdef void copy_all_in_order(float[::1, :] source, float[:, :, ::1] target,
+                            int order, int index) noexcept nogil:
+    # same as copy_in_order for all atoms; the source columns (x, y, z) are
+    # contiguous so for the 'fca' and 'cfa' layouts they are copied as a block
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t natoms = source.shape[0]
+    cdef Py_ssize_t ndims = source.shape[1]
     if order == 1:  #  'fac':
-        target[index] = source
+        for i in range(natoms):
+            for j in range(ndims):
+                target[index, i, j] = source[i, j]
     elif order == 2:  #  'fca':
-        target[index] = source.T
+        for j in range(ndims):
+            memcpy(&target[index, j, 0], &source[0, j], natoms * sizeof(float))
     elif order == 3:  # 'afc':
-        target[:, index] = source
+        for i in range(natoms):
+            for j in range(ndims):
+                target[i, index, j] = source[i, j]
     elif order == 4:  # 'acf':
-        target[:, :, index] = source
+        for i in range(natoms):
+            for j in range(ndims):
+                target[i, j, index] = source[i, j]
     elif order == 5:  # 'caf':
-        target[:, :, index] = source.T
+        for j in range(ndims):
+            for i in range(natoms):
+                target[j, i, index] = source[i, j]
     elif order == 6:  # 'cfa':
-        target[:, index] = source.T
+        for j in range(ndims):
+            memcpy(&target[j, index, 0], &source[0, j], natoms * sizeof(float))
@@ -195,15 +195,17 @@ class SelectionWriterBase(metaclass=_Selectionmeta):
         # build whole selection in one go (cleaner way to deal with
         # to deal with line breaks after self.numterms entries)
         # selection_list must contain entries to be joined with spaces or linebreaks
-        selection_terms = self._translate(selection.atoms)
-        step = self.numterms or len(selection.atoms)
+        atoms = selection.atoms
+        n_atoms = len(atoms)
+        selection_terms = self._translate(atoms)
+        step = self.numterms or n_atoms
 
         out = self._outfile
         self._write_head(out, name=name)
-        for iatom in range(0, len(selection.atoms), step):
+        for iatom in range(0, n_atoms, step):
             line = selection_terms[iatom:iatom + step]
             out.write(" ".join(line))
-            if len(line) == step and not iatom + step == len(selection.atoms):
+            if len(line) == step and not iatom + step == n_atoms:
                 out.write(' ' + self.continuation + '\n')
         out.write(' ')  # safe so that we don't have to put a space at the start of tail
         self._write_tail(out)
@@ -51,10 +51,10 @@ class SelectionWriter(base.SelectionWriterBase):
 
     def _translate(self, atoms, **kwargs):
         # CHARMM index is 1-based
-        def _index(atom):
-            return "BYNUM {0:d}".format((atom.index + 1))
+        def _index(ix):
+            return "BYNUM {0:d}".format(ix + 1)
 
-        return base.join(atoms, ' .or.', _index)
+        return base.join(atoms.indices, ' .or.', _index)
 
     def _write_head(self, out, **kwargs):
         out.write(self.comment("MDAnalysis CHARMM selection"))
@@ -49,7 +49,7 @@ class SelectionWriter(base.SelectionWriterBase):
 
     def _translate(self, atoms, **kwargs):
         # Gromacs index is 1-based; MDAnalysis is 0-based
-        return [str(atom.index + 1) for atom in atoms]
+        return (atoms.indices + 1).astype(str).tolist()
 
     def _write_head(self, out, **kwargs):
         out.write("[ {name!s} ]\n".format(**kwargs))
@@ -50,10 +50,10 @@ class SelectionWriter(base.SelectionWriterBase):
 
     def _translate(self, atoms, **kwargs):
         # Jmol indexing is 0 based when using atom bitsets
-        def _index(atom):
-            return str(atom.index)
+        def _index(ix):
+            return str(ix)
 
-        return base.join(atoms, ' ', _index)
+        return base.join(atoms.indices, ' ', _index)
 
     def _write_head(self, out, **kwargs):
         out.write("@~{name!s} ({{".format(**kwargs))
@@ -52,10 +52,10 @@ class SelectionWriter(base.SelectionWriterBase):
 
     def _translate(self, atoms, **kwargs):
         # PyMol index is 1-based
-        def _index(atom):
-            return "index {0:d}".format((atom.index + 1))
+        def _index(ix):
+            return "index {0:d}".format(ix + 1)
 
-        return base.join(atoms, ' |', _index)
+        return base.join(atoms.indices, ' |', _index)
 
     def _write_head(self, out, **kwargs):
         out.write(self.comment("MDAnalysis PyMol selection"))
@@ -62,7 +62,7 @@ class SelectionWriter(base.SelectionWriterBase):
 
     def _translate(self, atoms, **kwargs):
         # VMD index is 0-based (as is MDAnalysis)
-        return [str(atom.index) for atom in atoms]
+        return atoms.indices.astype(str).tolist()
 
     def _write_tail(self, out, **kwargs):
         out.write("}")
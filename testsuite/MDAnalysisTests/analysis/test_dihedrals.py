@@ -66,6 +66,15 @@ class TestDihedral(object):
                             err_msg="error: dihedral angles should "
                             "match test values")
 
+    @pytest.mark.parametrize('backend', ['serial', 'OpenMP'])
+    def test_dihedral_backend(self, atomgroup, backend):
+        dihedral = Dihedral([atomgroup], backend=backend).run()
+        test_dihedral = np.load(DihedralArray)
+
+        assert_allclose(dihedral.results.angles, test_dihedral, rtol=0, atol=1.5e-5,
+                            err_msg="error: dihedral angles should "
+                            "match test values")
+
     def test_enough_atoms(self, atomgroup):
         with pytest.raises(ValueError):
             dihedral = Dihedral([atomgroup[:2]]).run()
@@ -103,6 +112,15 @@ class TestRamachandran(object):
                             err_msg="error: dihedral angles should "
                             "match test values")
 
+    @pytest.mark.parametrize('backend', ['serial', 'OpenMP'])
+    def test_ramachandran_backend(self, universe, rama_ref_array, backend):
+        rama = Ramachandran(universe.select_atoms("protein"),
+                            backend=backend).run()
+
+        assert_allclose(rama.results.angles, rama_ref_array, rtol=0, atol=1.5e-5,
+                            err_msg="error: dihedral angles should "
+                            "match test values")
+
     def test_ramachandran_residue_selections(self, universe):
         rama = Ramachandran(universe.select_atoms("resname GLY")).run()
         test_rama = np.load(GLYRamaArray)
@@ -180,6 +198,14 @@ class TestJanin(object):
                             err_msg="error: dihedral angles should "
                             "match test values")
 
+    @pytest.mark.parametrize('backend', ['serial', 'OpenMP'])
+    def test_janin_backend(self, universe, janin_ref_array, backend):
+        janin = Janin(universe.select_atoms("protein"), backend=backend).run()
+
+        assert_allclose(janin.results.angles, janin_ref_array, rtol=0, atol=1.5e-3,
+                            err_msg="error: dihedral angles should "
+                            "match test values")
+
     def test_janin_residue_selections(self, universe):
         janin = Janin(universe.select_atoms("resname LYS")).run()
         test_janin = np.load(LYSJaninArray)
@@ -25,6 +25,7 @@ from unittest.mock import patch
 
 import MDAnalysis as mda
 from MDAnalysis.analysis.gnm import (GNMAnalysis, closeContactGNMAnalysis)
+from MDAnalysis.lib.distances import distance_array
 
 from numpy.testing import assert_almost_equal
 import numpy as np
@@ -51,6 +52,38 @@ def test_gnm(universe, tmpdir):
        4.2058769e-15, 3.9839431e-15])
 
 
+def test_generate_kirchoff_bonus_groups(universe):
+    bonus = ('resid 5 and not name CA', 'resid 100 to 102 and not name CA')
+    gnm = GNMAnalysis(universe, Bonus_groups=bonus)
+    matrix = gnm.generate_kirchoff()
+
+    ca = universe.select_atoms('protein and name CA')
+    positions = np.vstack([ca.positions] +
+                          [universe.select_atoms(sel).center_of_mass()
+                           for sel in bonus])
+    contacts = distance_array(positions, positions) < gnm.cutoff
+    np.fill_diagonal(contacts, False)
+    reference = np.diag(contacts.sum(axis=1)) - contacts
+
+    assert matrix.shape == (ca.n_atoms + 2, ca.n_atoms + 2)
+    assert_almost_equal(matrix, reference)
+
+
+@pytest.mark.parametrize('bonus', [
+    ('resid 5 and not name CA', 'resname FOO', 'resid 7 and not name CA'),
+    ('resid 5 and not name CA', 'resname FOO'),
+])
+def test_bonus_groups_empty(universe, bonus):
+    with pytest.raises(ValueError, match="is empty"):
+        GNMAnalysis(universe, Bonus_groups=bonus)
+
+
+def test_bonus_groups_zero_mass(universe):
+    universe.select_atoms('resid 5').masses = 0
+    with pytest.raises(ValueError, match="zero total mass"):
+        GNMAnalysis(universe, Bonus_groups=('resid 5 and not name CA',))
+
+
 def test_gnm_run_step(universe):
     gnm = GNMAnalysis(universe)
     gnm.run(step=3)
@@ -469,6 +469,14 @@ class BaseReaderTest(object):
         assert(timeseries.shape[f_index] == len(reader))
         assert(timeseries.shape[c_index] == 3)
 
+    @pytest.mark.parametrize('order', ('fac', 'fca', 'afc', 'acf', 'caf', 'cfa'))
+    def test_timeseries_order_values(self, reader, order):
+        reference = reader.timeseries(order='fac')
+        timeseries = reader.timeseries(order=order)
+        assert_allclose(timeseries,
+                        np.moveaxis(reference, [0, 1, 2],
+                                    [order.index(i) for i in 'fac']))
+
     @pytest.mark.parametrize('slice', ([0,2,1], [0,10,2], [0,10,3]))
     def test_timeseries_values(self, reader, slice):
         ts_positions = []
@@ -142,6 +142,11 @@ class _TestReader(object):
         with pytest.raises(ValueError, match="Repeated or missing keys"):
             reader.timeseries(order=order)
 
+    @pytest.mark.parametrize('order', ['fac', 'fca', 'afc', 'acf', 'caf', 'cfa'])
+    def test_timeseries_contiguous(self, reader, order):
+        timeseries = reader.timeseries(order=order)
+        assert timeseries.flags['C_CONTIGUOUS']
+
 class _Multi(_TestReader):
     n_frames = 10
     n_atoms = 10
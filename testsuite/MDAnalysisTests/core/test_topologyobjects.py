@@ -22,13 +22,15 @@
 #
 import numpy as np
 from numpy.testing import (
+    assert_allclose,
     assert_almost_equal,
     assert_equal,
 )
 import pytest
 
 import MDAnalysis as mda
-from MDAnalysis.lib.distances import calc_bonds, calc_angles, calc_dihedrals
+from MDAnalysis.lib.distances import (calc_bonds, calc_angles, calc_dihedrals,
+                                      HAS_DISTOPIA)
 from MDAnalysisTests.datafiles import LAMMPSdata_many_bonds
 from MDAnalysis.core.topologyobjects import (
     TopologyGroup, TopologyObject, TopologyDict,
@@ -37,7 +39,7 @@ from MDAnalysis.core.topologyobjects import (
 )
 
 
-from MDAnalysisTests.datafiles import PSF, DCD, TRZ_psf, TRZ
+from MDAnalysisTests.datafiles import PSF, DCD, TRZ_psf, TRZ, TPR, XTC
 
 
 @pytest.fixture(scope='module')
@@ -227,6 +229,19 @@ class TestTopologyObjects(object):
         with pytest.raises(ValueError):
             cmap = PSFDCD.atoms[[30, 10, 2]].cmap
 
+    @pytest.mark.parametrize('ix, attr', [
+        ([0, 4], 'bond'),
+        ([0, 4, 1], 'angle'),
+        ([4, 7, 8, 1], 'dihedral'),
+        ([4, 7, 8, 1], 'improper'),
+        ([30, 10], 'ureybradley'),
+        ([4, 7, 8, 1, 2], 'cmap'),
+    ])
+    def test_no_instance_dict(self, PSFDCD, ix, attr):
+        obj = getattr(PSFDCD.atoms[ix], attr)
+
+        assert not hasattr(obj, '__dict__')
+
 class TestTopologyGroup(object):
     """Tests TopologyDict and TopologyGroup classes with psf input"""
 
@@ -376,6 +391,15 @@ class TestTopologyGroup(object):
         assert_equal(tg[0].indices, (0, 10))
         assert_equal(tg[1].indices, (5, 15))
 
+    def test_tg_vertical_atomgroups_lazy(self, PSFDCD):
+        vals = np.array([[0, 10], [5, 15]])
+        tg = TopologyGroup(vals, PSFDCD)
+
+        assert 'ags' not in tg._cache
+        assert_equal(tg.atom1.indices, [0, 5])
+        assert_equal(tg.atom2.indices, [10, 15])
+        assert 'ags' in tg._cache
+
     def test_angle_tg_creation_notype(self, PSFDCD):
         vals = np.array([[0, 5, 10], [5, 10, 15]])
         tg = TopologyGroup(vals, PSFDCD)
@@ -742,6 +766,60 @@ class TestTopologyGroup_Cython(object):
                                    box=PSFDCD.dimensions))
 
 
+class TestTopologyGroup_NumPy(object):
+    """Check the vectorized NumPy versions against the Cython functions"""
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def u():
+        return mda.Universe(TPR, XTC)
+
+    @pytest.mark.parametrize('btype', ['bonds', 'angles', 'dihedrals'])
+    @pytest.mark.parametrize('pbc', [True, False])
+    def test_slow_values(self, u, btype, pbc):
+        tg = getattr(u.atoms, btype)
+        slow = getattr(tg, '_{}_slow'.format(btype))(pbc=pbc)
+        assert_allclose(slow, getattr(tg, btype)(pbc=pbc), rtol=0, atol=1.5e-4)
+
+    def test_slow_impropers(self, PSFDCD):
+        tg = PSFDCD.atoms.impropers
+        assert_allclose(tg._dihedrals_slow(), tg.dihedrals(),
+                        rtol=0, atol=1.5e-4)
+
+    @pytest.mark.parametrize('btype, kind', [('bonds', 'angles'),
+                                             ('angles', 'dihedrals'),
+                                             ('dihedrals', 'bonds')])
+    def test_slow_wrong_type(self, u, btype, kind):
+        with pytest.raises(TypeError):
+            getattr(getattr(u.atoms, btype), '_{}_slow'.format(kind))()
+
+    def test_slow_empty(self, u):
+        assert len(u.atoms[[]].bonds._bonds_slow()) == 0
+
+
+class TestTopologyGroup_Backend(object):
+    """Check that the distance backend is forwarded to lib.distances"""
+    @staticmethod
+    @pytest.fixture(scope='class')
+    def u():
+        return mda.Universe(TPR, XTC)
+
+    @pytest.mark.parametrize('btype, backend', [
+        ('bonds', 'OpenMP'),
+        pytest.param('bonds', 'distopia', marks=pytest.mark.skipif(
+            not HAS_DISTOPIA, reason="distopia not installed")),
+        ('angles', 'OpenMP'),
+        ('dihedrals', 'OpenMP'),
+    ])
+    @pytest.mark.parametrize('pbc', [True, False])
+    def test_values_backend(self, u, btype, backend, pbc):
+        tg = getattr(u.atoms, btype)
+        ref = getattr(tg, btype)(pbc=pbc)
+        assert_allclose(getattr(tg, btype)(pbc=pbc, backend=backend), ref,
+                        rtol=0, atol=1.5e-5)
+        assert_allclose(tg.values(pbc=pbc, backend=backend), ref,
+                        rtol=0, atol=1.5e-5)
+
+
 def test_bond_length_pbc():
     u = mda.Universe(TRZ_psf, TRZ)
 
@@ -260,6 +260,14 @@ class TestUniverseFromSmiles(object):
         with pytest.raises(SyntaxError) as e:
             u = mda.Universe.from_smiles("CCO", numConfs=2.1, format='RDKIT')
             assert "non-zero positive integer" in str (e.value)
+        with pytest.raises(SyntaxError) as e:
+            u = mda.Universe.from_smiles("CCO", numConfs=True, format='RDKIT')
+            assert "non-zero positive integer" in str (e.value)
+
+    def test_generate_coordinates_numConfs_numpy_int(self):
+        u = mda.Universe.from_smiles("CCO", numConfs=np.int64(2),
+                                     format='RDKIT')
+        assert u.trajectory.n_frames == 2
 
     def test_rdkit_kwargs(self):
         # test for bad kwarg:
@@ -575,6 +575,33 @@ def test_readframes_atomindices(indices, dcd):
     assert_array_almost_equal(xyz, allframes[indices])
 
 
+@pytest.mark.parametrize("order", ('fac', 'fca', 'afc', 'acf', 'caf', 'cfa'))
+def test_readframes_atomindices_order(order, dcd):
+    indices = [9, 4, 2, 0, 50, -1]
+    allframes = dcd.readframes(start=2, stop=10, step=3, order='afc').xyz
+    xyz = dcd.readframes(start=2, stop=10, step=3, order=order,
+                         indices=indices).xyz
+    ref = np.moveaxis(allframes[indices], ['afc'.index(i) for i in order],
+                      [0, 1, 2])
+    assert_array_almost_equal(xyz, ref)
+
+
+@pytest.mark.parametrize("order", ('fac', 'fca', 'afc', 'acf', 'caf', 'cfa'))
+@pytest.mark.parametrize("slice", ((None, None, None), (2, 10, 3)))
+def test_readframes_all_atoms_order(order, slice, dcd):
+    start, stop, step = slice
+    indices = np.arange(dcd.header['natoms'])
+    ref = dcd.readframes(start=start, stop=stop, step=step, order=order,
+                         indices=indices).xyz
+    xyz = dcd.readframes(start=start, stop=stop, step=step, order=order).xyz
+    assert_array_equal(xyz, ref)
+
+
+def test_readframes_atomindices_out_of_range(dcd):
+    with pytest.raises(IndexError):
+        dcd.readframes(indices=[0, 3341])
+
+
 def test_write_random_unitcell(tmpdir):
     testname = str(tmpdir.join('test.dcd'))
     rstate = np.random.RandomState(1178083)
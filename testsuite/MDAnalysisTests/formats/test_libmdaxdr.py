@@ -28,6 +28,7 @@ from numpy.testing import (assert_almost_equal, assert_array_almost_equal,
                            assert_array_equal, assert_equal)
 
 from MDAnalysis.lib.formats.libmdaxdr import TRRFile, XTCFile
+from MDAnalysis.lib.formats.cython_util import ArrayWrapper
 
 from MDAnalysisTests.datafiles import TRR_multi_frame, XTC_multi_frame
 
@@ -204,6 +205,16 @@ class TestOffsets(object):
     def test_offset(self, reader, offsets):
         assert_array_equal(reader.offsets, offsets)
 
+    def test_offsets_not_copied(self, reader, offsets):
+        # the offsets are a view on the memory allocated by the xdr library,
+        # which is owned (and freed) by the ArrayWrapper base object
+        calculated = reader.calc_offsets()
+        base = calculated
+        while isinstance(base, np.ndarray):
+            base = base.base
+        assert isinstance(base, ArrayWrapper)
+        assert_array_equal(calculated, offsets)
+
     def test_set_offsets(self, reader, offsets):
         reader.set_offsets(np.arange(len(offsets)))
         assert_array_equal(reader.offsets, np.arange(len(offsets)))